@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Usage examples for the Dual-Mode AI Assistant.
+
+Runs a few single requests in each mode, then a concurrent batch that
+exercises the shared HTTP connection pool.
+"""
+
+import asyncio
+import time
+
+from dotenv import load_dotenv
+
+from src.core.assistant import DualModeAssistant
+
+# Load environment variables from .env file
+load_dotenv()
+
+# One shared assistant so the HTTP pool, cached agents, and response
+# cache amortize across every example
+ASSISTANT = DualModeAssistant()
+
+
+async def basic_examples() -> None:
+    """Run a couple of single requests in each mode."""
+    assistant = ASSISTANT
+
+    requests = [
+        "conversational: What makes Python good for beginners?",
+        "rephrasing: me and my friend goes to school every day",
+    ]
+
+    for request in requests:
+        result = await assistant.process_single_request(request)
+        if result["success"]:
+            print(f"✅ [{result['mode']}] {result['response']}")
+        else:
+            print(f"❌ {result['error']}")
+        print()
+
+
+async def concurrent_example() -> None:
+    """Process several requests concurrently over the pooled client."""
+    assistant = ASSISTANT
+
+    requests = [
+        "conversational: What is machine learning?",
+        "rephrasing: me and my friend goes to school",
+        "conversational: How does async work?",
+        "rephrasing: this code work good",
+    ]
+
+    # Submit all tasks first, then await — an await between submissions
+    # would silently serialize the batch
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(assistant.process_single_request(request))
+        for request in requests
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"❌ {result}")
+        elif result["success"]:
+            print(f"✅ [{result['mode']}] {result['response']}")
+        else:
+            print(f"❌ {result['error']}")
+
+    print(f"\n⏱️  {len(requests)} concurrent requests in {elapsed:.2f}s")
+
+
+async def main() -> None:
+    """Run all examples."""
+    print("=" * 50)
+    print("Basic examples")
+    print("=" * 50)
+    await basic_examples()
+
+    print("=" * 50)
+    print("Concurrent example")
+    print("=" * 50)
+    await concurrent_example()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,21 +1,124 @@
 """AI Agent Manager for handling different types of AI agents."""
 
+import asyncio
+import atexit
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from typing import ClassVar, Final
+
+import httpx
 from dotenv import load_dotenv
+from openai import AsyncOpenAI
 from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelRequest, UserPromptPart
+from pydantic_ai.models import Model
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from src.ai.semantic_cache import SemanticCache
+from src.core.llm_cache import LLMCache
+
+# Parse .env once at import; per-instance loading re-read the file from
+# disk on every AgentManager construction
+load_dotenv()
+
+# Interned once at import time so every AgentManager instance shares the
+# same prompt string objects
+_CONVERSATION_SYSTEM_PROMPT: Final[str] = (
+    "You are a friendly, helpful, and engaging conversational AI assistant. "
+    "Your personality is warm, approachable, and genuinely interested in "
+    "helping users. You should:\n"
+    "- Be conversational and natural in your responses\n"
+    "- Show enthusiasm and interest in the user's questions\n"
+    "- Provide helpful and detailed answers when needed\n"
+    "- Ask follow-up questions to better understand what the user needs\n"
+    "- Use a warm, friendly tone like you're talking to a good friend\n"
+    "- Remember context from the conversation to make it flow naturally\n"
+    "- Be encouraging and supportive\n"
+    "- Keep responses engaging but not overly long unless requested"
+)
+
+_REPHRASING_SYSTEM_PROMPT: Final[str] = (
+    "You are a professional writing assistant specialized in rephrasing "
+    "and grammar correction. Your job is to improve text while preserving "
+    "the original meaning, tone, and intent. You should:\n"
+    "- Fix grammar, spelling, and punctuation errors\n"
+    "- Improve clarity and readability\n"
+    "- Enhance word choice and sentence structure\n"
+    "- Maintain the original tone and style\n"
+    "- Preserve the author's voice and intent\n"
+    "- Return ONLY the improved version without explanations or commentary\n"
+    "- Keep the same level of formality as the original\n"
+    "- Don't add new information or change the meaning"
+)
+
+_SYSTEM_PROMPTS: Final[dict[str, str]] = {
+    "conversational": _CONVERSATION_SYSTEM_PROMPT,
+    "rephrasing": _REPHRASING_SYSTEM_PROMPT,
+}
+
+_CTX_HEADER: Final[str] = "Previous conversation:\n"
+
+# One process-wide HTTP client: subsequent calls skip the TCP+TLS
+# handshake entirely, and HTTP/2 multiplexes concurrent batch requests
+# over a single connection
+_HTTP_CLIENT: Final[httpx.AsyncClient] = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+    ),
+    timeout=httpx.Timeout(60.0, connect=10.0),
+)
+
+
+def _close_http_client() -> None:
+    """Close the shared HTTP client at interpreter shutdown."""
+    if not _HTTP_CLIENT.is_closed:
+        # A still-running loop owns the client; let process teardown
+        # reclaim the sockets
+        with contextlib.suppress(RuntimeError):
+            asyncio.run(_HTTP_CLIENT.aclose())
+
+
+atexit.register(_close_http_client)
 
 
 class AgentManager:
     """Manages AI agents for different modes and operations."""
 
-    def __init__(self, model_name: str = "openai:gpt-4o"):
+    CONVERSATION_SYSTEM_PROMPT = _CONVERSATION_SYSTEM_PROMPT
+    REPHRASING_SYSTEM_PROMPT = _REPHRASING_SYSTEM_PROMPT
+    SYSTEM_PROMPTS = _SYSTEM_PROMPTS
+
+    # Agents memoized per (model_name, mode) so repeated instantiations in
+    # tests and examples share one agent object and one HTTP client
+    _AGENTS: ClassVar[dict[tuple[str, str], Agent]] = {}
+
+    def __init__(
+        self,
+        model_name: str = "openai:gpt-4o",
+        response_cache: LLMCache | None = None,
+        embedding_client=None,
+    ):
         """
         Initialize the agent manager.
 
         Args:
             model_name: The AI model to use for all agents
+            response_cache: Optional response cache for deterministic requests
+            embedding_client: Optional async embeddings client; enables the
+                semantic cache for near-duplicate queries when provided
         """
-        load_dotenv()
         self.model_name = model_name
+        self.response_cache = response_cache if response_cache else LLMCache()
+        self.semantic_cache: SemanticCache | None = (
+            SemanticCache(embedding_client) if embedding_client else None
+        )
+        # All instances share the process-wide pooled client so agent runs
+        # multiplex over warm keep-alive connections
+        self._http_client = _HTTP_CLIENT
+        self._model: Model | str | None = None
         self._conversation_agent: Agent | None = None
         self._rephrasing_agent: Agent | None = None
 
@@ -33,42 +136,66 @@ class AgentManager:
             self._rephrasing_agent = self._create_rephrasing_agent()
         return self._rephrasing_agent
 
+    def _get_model(self) -> Model | str:
+        """
+        Get or build the model backed by the shared HTTP client.
+
+        Returns:
+            An OpenAI model wired to the pooled client, or the raw model
+            name for non-OpenAI backends
+        """
+        if self._model is None:
+            if self.model_name.startswith("openai:"):
+                self._model = OpenAIChatModel(
+                    self.model_name.removeprefix("openai:"),
+                    provider=OpenAIProvider(http_client=self._http_client),
+                )
+            else:
+                self._model = self.model_name
+        return self._model
+
     def _create_conversation_agent(self) -> Agent:
-        """Create a conversational AI agent."""
-        system_prompt = (
-            "You are a friendly, helpful, and engaging conversational AI assistant. "
-            "Your personality is warm, approachable, and genuinely interested in "
-            "helping users. You should:\n"
-            "- Be conversational and natural in your responses\n"
-            "- Show enthusiasm and interest in the user's questions\n"
-            "- Provide helpful and detailed answers when needed\n"
-            "- Ask follow-up questions to better understand what the user needs\n"
-            "- Use a warm, friendly tone like you're talking to a good friend\n"
-            "- Remember context from the conversation to make it flow naturally\n"
-            "- Be encouraging and supportive\n"
-            "- Keep responses engaging but not overly long unless requested"
-        )
-        return Agent(self.model_name, system_prompt=system_prompt)
+        """Create (or reuse) a conversational AI agent."""
+        key = (self.model_name, "conversational")
+        agent = self._AGENTS.get(key)
+        if agent is None:
+            agent = Agent(self._get_model(), system_prompt=_CONVERSATION_SYSTEM_PROMPT)
+            self._AGENTS[key] = agent
+        return agent
 
     def _create_rephrasing_agent(self) -> Agent:
-        """Create a rephrasing/grammar correction agent."""
-        system_prompt = (
-            "You are a professional writing assistant specialized in rephrasing "
-            "and grammar correction. Your job is to improve text while preserving "
-            "the original meaning, tone, and intent. You should:\n"
-            "- Fix grammar, spelling, and punctuation errors\n"
-            "- Improve clarity and readability\n"
-            "- Enhance word choice and sentence structure\n"
-            "- Maintain the original tone and style\n"
-            "- Preserve the author's voice and intent\n"
-            "- Return ONLY the improved version without explanations or commentary\n"
-            "- Keep the same level of formality as the original\n"
-            "- Don't add new information or change the meaning"
-        )
-        return Agent(self.model_name, system_prompt=system_prompt)
+        """Create (or reuse) a rephrasing/grammar correction agent."""
+        key = (self.model_name, "rephrasing")
+        agent = self._AGENTS.get(key)
+        if agent is None:
+            agent = Agent(self._get_model(), system_prompt=_REPHRASING_SYSTEM_PROMPT)
+            self._AGENTS[key] = agent
+        return agent
+
+    @staticmethod
+    def _history_from_context(context: str) -> list[ModelMessage]:
+        """
+        Wrap a legacy context string as a standalone history message.
+
+        Keeping dynamic context out of the prompt string leaves the static
+        system prompt byte-identical across calls, so provider-side prompt
+        caching can reuse the prefilled prefix.
+
+        Args:
+            context: Pre-formatted conversation context
+
+        Returns:
+            A single-message history carrying the context
+        """
+        return [ModelRequest(parts=[UserPromptPart(content=_CTX_HEADER + context)])]
 
     async def get_response(
-        self, content: str, mode: str, context: str | None = None
+        self,
+        content: str,
+        mode: str,
+        context: str | None = None,
+        deterministic: bool = False,
+        message_history: list[ModelMessage] | None = None,
     ) -> str:
         """
         Get a response from the appropriate agent based on mode (async version).
@@ -77,6 +204,8 @@ class AgentManager:
             content: The user's input content
             mode: The mode ('conversational' or 'rephrasing')
             context: Optional conversation context for conversational mode
+            deterministic: Whether the request is safe to serve from cache
+            message_history: Optional structured history, preferred over context
 
         Returns:
             The agent's response
@@ -84,43 +213,255 @@ class AgentManager:
         Raises:
             ValueError: If mode is not supported
         """
+        cache_key = None
+        if deterministic:
+            cache_key = LLMCache.make_key(self.model_name, mode, content, context)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Semantic lookup is gated to rephrasing/deterministic calls so
+        # context-specific conversational answers never leak across queries
+        query_embedding = None
+        if self.semantic_cache is not None and (mode == "rephrasing" or deterministic):
+            query_text = f"{context}\n{content}" if context else content
+            query_embedding = await self.semantic_cache.embed(query_text)
+            cached = self.semantic_cache.lookup(query_embedding, mode)
+            if cached is not None:
+                return cached
+
         if mode == "conversational":
-            prompt = content
-            if context:
-                prompt = f"Previous conversation:\n{context}\n\nHuman: {content}"
-            result = await self.conversation_agent.run(prompt)
-            return str(result)
+            history = message_history
+            if history is None and context:
+                history = self._history_from_context(context)
+            result = await self.conversation_agent.run(content, message_history=history)
+            response = str(result)
         elif mode == "rephrasing":
             result = await self.rephrasing_agent.run(content)
-            return str(result)
+            response = str(result)
         else:
             raise ValueError(f"Unsupported mode: {mode}")
 
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+        if query_embedding is not None:
+            self.semantic_cache.add(query_embedding, mode, response)
+        return response
+
     def get_response_sync(
-        self, content: str, mode: str, context: str | None = None
+        self,
+        content: str,
+        mode: str,
+        context: str | None = None,
+        deterministic: bool = False,
+        message_history: list[ModelMessage] | None = None,
     ) -> str:
         """
         Synchronous version of get_response for backward compatibility.
 
+        A thin wrapper over the async implementation, so caching, message
+        history, and other hot-path improvements apply to both entry points.
+
         Args:
             content: The user's input content
             mode: The mode ('conversational' or 'rephrasing')
             context: Optional conversation context for conversational mode
+            deterministic: Whether the request is safe to serve from cache
+            message_history: Optional structured history, preferred over context
 
         Returns:
             The agent's response
 
+        Raises:
+            ValueError: If mode is not supported
+            RuntimeError: If called from within a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.get_response(
+                    content,
+                    mode,
+                    context,
+                    deterministic=deterministic,
+                    message_history=message_history,
+                )
+            )
+        raise RuntimeError(
+            "get_response_sync() cannot be used inside a running event loop; "
+            "await get_response() instead"
+        )
+
+    async def warmup(self) -> None:
+        """
+        Construct both agents in parallel ahead of the first request.
+
+        Agent construction (model resolution, provider setup) otherwise
+        lands serially on the first user-visible request of each mode.
+        """
+        await asyncio.gather(
+            asyncio.to_thread(lambda: self.conversation_agent),
+            asyncio.to_thread(lambda: self.rephrasing_agent),
+        )
+
+    async def stream_response(
+        self,
+        content: str,
+        mode: str,
+        context: str | None = None,
+        message_history: list[ModelMessage] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the appropriate agent chunk by chunk.
+
+        Streaming cuts perceived latency to time-to-first-token instead of
+        full generation time; callers can render chunks as they arrive.
+
+        Args:
+            content: The user's input content
+            mode: The mode ('conversational' or 'rephrasing')
+            context: Optional conversation context for conversational mode
+            message_history: Optional structured history, preferred over context
+
+        Yields:
+            Incremental text deltas of the response
+
         Raises:
             ValueError: If mode is not supported
         """
         if mode == "conversational":
-            prompt = content
-            if context:
-                prompt = f"Previous conversation:\n{context}\n\nHuman: {content}"
-            result = self.conversation_agent.run_sync(prompt)
-            return str(result)
+            history = message_history
+            if history is None and context:
+                history = self._history_from_context(context)
+            async with self.conversation_agent.run_stream(
+                content, message_history=history
+            ) as result:
+                async for chunk in result.stream_text(delta=True):
+                    yield chunk
         elif mode == "rephrasing":
-            result = self.rephrasing_agent.run_sync(content)
-            return str(result)
+            async with self.rephrasing_agent.run_stream(content) as result:
+                async for chunk in result.stream_text(delta=True):
+                    yield chunk
         else:
             raise ValueError(f"Unsupported mode: {mode}")
+
+    async def get_responses_batch(
+        self,
+        items: list[tuple[str, str, str | None]],
+        max_concurrency: int = 16,
+    ) -> list[str | Exception]:
+        """
+        Fan out many requests concurrently with a bounded semaphore.
+
+        All tasks are scheduled before any is awaited, so N requests cost
+        one round-trip of wall time (up to provider concurrency) instead of
+        N. Failures are reported in place without cancelling the rest.
+
+        Args:
+            items: (content, mode, context) tuples, one per request
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            Responses (or exceptions for failed requests) in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(content: str, mode: str, context: str | None) -> str:
+            async with semaphore:
+                return await self.get_response(content, mode, context)
+
+        # Submit everything first, then await — an await interleaved with
+        # task creation would serialize the batch
+        tasks = [
+            asyncio.create_task(bounded(content, mode, context))
+            for content, mode, context in items
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_responses_batch_api(
+        self,
+        contents: list[str],
+        mode: str,
+        poll_interval: float = 5.0,
+        completion_window: str = "24h",
+    ) -> list[str]:
+        """
+        Process a group of same-mode requests through the OpenAI Batch API.
+
+        Batched requests are billed at half the token price and amortize
+        per-request HTTP overhead, at the cost of asynchronous completion
+        (the API guarantees results within the completion window).
+
+        Args:
+            contents: The user inputs, one request per entry
+            mode: The mode ('conversational' or 'rephrasing') for all entries
+            poll_interval: Seconds between batch status polls
+            completion_window: Completion window accepted by the Batch API
+
+        Returns:
+            Responses in the same order as contents
+
+        Raises:
+            ValueError: If mode is not supported
+            RuntimeError: If the batch does not complete successfully
+        """
+        if mode not in self.SYSTEM_PROMPTS:
+            raise ValueError(f"Unsupported mode: {mode}")
+
+        system_prompt = self.SYSTEM_PROMPTS[mode]
+        model = self.model_name.removeprefix("openai:")
+        client = AsyncOpenAI(http_client=self._http_client)
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": content},
+                        ],
+                    },
+                }
+            )
+            for index, content in enumerate(contents)
+        ]
+        payload = "\n".join(lines).encode()
+
+        batch_file = await client.files.create(
+            file=("batch.jsonl", payload), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+        )
+
+        while batch.status not in ("completed", "failed", "cancelled", "expired"):
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+
+        output = await client.files.content(batch.output_file_id)
+        responses: dict[int, str] = {}
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            row = json.loads(line)
+            body = row["response"]["body"]
+            responses[int(row["custom_id"])] = body["choices"][0]["message"]["content"]
+
+        # Stitch results back to the original submission order
+        return [responses.get(index, "") for index in range(len(contents))]
+
+    def clear_cache(self) -> None:
+        """Clear the response cache and the semantic cache, if enabled."""
+        self.response_cache.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
@@ -0,0 +1,117 @@
+"""Semantic response caching based on embedding similarity."""
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for LLM responses.
+
+    Near-duplicate prompts ("What is Python used for?" vs "Tell me what
+    Python is used for") miss an exact-match cache even though the answer
+    is interchangeable. This cache embeds the query, compares it against
+    stored entries with a normalized dot product, and returns the cached
+    response when the best same-mode match exceeds a similarity threshold.
+    """
+
+    def __init__(
+        self,
+        embedding_client,
+        embedding_model: str = "text-embedding-3-small",
+        threshold: float = 0.92,
+        max_entries: int = 512,
+    ) -> None:
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embedding_client: An async OpenAI-compatible client with an
+                embeddings.create endpoint
+            embedding_model: The embedding model to use for queries
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of entries before oldest are evicted
+        """
+        self.embedding_client = embedding_client
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Normalized embeddings stacked as an (n, d) matrix so lookup is a
+        # single matrix-vector product
+        self._embeddings: np.ndarray | None = None
+        self._modes: list[str] = []
+        self._responses: list[str] = []
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a query and normalize it for cosine similarity.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            A unit-norm float32 embedding vector
+        """
+        result = await self.embedding_client.embeddings.create(
+            model=self.embedding_model, input=text
+        )
+        vector = np.asarray(result.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def lookup(self, query_embedding: np.ndarray, mode: str) -> str | None:
+        """
+        Find the best cached response for a query embedding.
+
+        Args:
+            query_embedding: Unit-norm embedding of the query
+            mode: The assistant mode the response must match
+
+        Returns:
+            The cached response if similarity exceeds the threshold, else None
+        """
+        if self._embeddings is None:
+            self.misses += 1
+            return None
+
+        # Vectors are normalized at insert time, so similarity is one dot
+        similarities = self._embeddings @ query_embedding
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < self.threshold:
+                break
+            if self._modes[index] == mode:
+                self.hits += 1
+                return self._responses[index]
+
+        self.misses += 1
+        return None
+
+    def add(self, query_embedding: np.ndarray, mode: str, response: str) -> None:
+        """
+        Insert a response under its query embedding.
+
+        Args:
+            query_embedding: Unit-norm embedding of the query
+            mode: The assistant mode the response belongs to
+            response: The response text to cache
+        """
+        row = query_embedding.reshape(1, -1)
+        if self._embeddings is None:
+            self._embeddings = row
+        else:
+            self._embeddings = np.vstack((self._embeddings, row))
+        self._modes.append(mode)
+        self._responses.append(response)
+
+        if len(self._responses) > self.max_entries:
+            self._embeddings = self._embeddings[1:]
+            del self._modes[0]
+            del self._responses[0]
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset stats."""
+        self._embeddings = None
+        self._modes.clear()
+        self._responses.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,5 +1,7 @@
 """Main dual-mode AI assistant orchestrating all components."""
 
+import asyncio
+
 from src.ai.agent_manager import AgentManager
 from src.core.conversation_manager import ConversationManager
 from src.helpers.input_parser import InputParser, Mode, ParsedInput
@@ -9,23 +11,33 @@ from src.helpers.ui_helper import UIHelper
 class DualModeAssistant:
     """Main orchestrator for the dual-mode AI assistant."""
 
-    def __init__(self, model_name: str = "openai:gpt-4o"):
+    def __init__(
+        self, model_name: str = "openai:gpt-4o", max_context_tokens: int = 1500
+    ):
         """
         Initialize the dual-mode assistant.
 
         Args:
             model_name: The AI model to use for all agents
+            max_context_tokens: Token budget for conversational context
         """
         self.agent_manager = AgentManager(model_name)
-        self.conversation_manager = ConversationManager()
+        self.conversation_manager = ConversationManager(
+            max_context_tokens=max_context_tokens
+        )
         self.ui_helper = UIHelper()
         self.input_parser = InputParser()
 
     async def start_interactive_session(self) -> None:
         """Start an interactive chat session."""
+        # Warm both agents while the welcome banner prints so the first
+        # request doesn't pay initialization cost
+        warmup_task = asyncio.create_task(self.agent_manager.warmup())
+
         self.ui_helper.print_welcome()
 
         try:
+            await warmup_task
             await self._chat_loop()
         except KeyboardInterrupt:
             self.ui_helper.print_error("\nConversation interrupted. Goodbye!")
@@ -89,6 +101,10 @@ class DualModeAssistant:
         Args:
             content: The user's message content
         """
+        # Capture history before recording the new message so the current
+        # turn isn't duplicated in the context
+        history = self.conversation_manager.get_history_messages()
+
         # Add user message to conversation history
         self.conversation_manager.add_user_message(content)
 
@@ -96,16 +112,17 @@ class DualModeAssistant:
         self.ui_helper.print_thinking_indicator("conversational")
 
         try:
-            # Get AI response
-            response = await self.agent_manager.get_response(
-                content, "conversational", self.conversation_manager.get_context()
-            )
-
-            # Print response
-            print(response)
+            # Stream the response so the first token prints immediately
+            chunks = []
+            async for chunk in self.agent_manager.stream_response(
+                content, "conversational", message_history=history or None
+            ):
+                print(chunk, end="", flush=True)
+                chunks.append(chunk)
+            print()
 
             # Add AI response to history
-            self.conversation_manager.add_assistant_message(response)
+            self.conversation_manager.add_assistant_message("".join(chunks))
 
         except Exception as e:
             self.ui_helper.print_error(f"Sorry, I couldn't process that: {e}")
@@ -121,21 +138,31 @@ class DualModeAssistant:
         self.ui_helper.print_thinking_indicator("rephrasing")
 
         try:
-            # Get AI response (no context needed for rephrasing)
-            response = await self.agent_manager.get_response(content, "rephrasing")
-
-            # Print response
-            print(response)
+            # Stream the response (no context needed for rephrasing)
+            async for chunk in self.agent_manager.stream_response(
+                content, "rephrasing"
+            ):
+                print(chunk, end="", flush=True)
+            print()
 
         except Exception as e:
             self.ui_helper.print_error(f"Sorry, I couldn't rephrase that: {e}")
 
-    async def process_single_request(self, user_input: str) -> dict:
+    async def process_single_request(
+        self,
+        user_input: str,
+        deterministic: bool = False,
+        conversation_manager: ConversationManager | None = None,
+    ) -> dict:
         """
         Process a single request and return the result (async version).
 
         Args:
             user_input: The raw user input
+            deterministic: Whether the request may be served from the response cache
+            conversation_manager: Optional external history; conversational
+                requests read context from it and record the exchange, so
+                one assistant can serve many independent conversations
 
         Returns:
             Dictionary containing response data and metadata
@@ -151,13 +178,21 @@ class DualModeAssistant:
 
         try:
             if parsed_input.mode == Mode.CONVERSATIONAL:
-                # For single requests, don't use conversation history
+                history = None
+                if conversation_manager is not None:
+                    history = conversation_manager.get_history_messages() or None
+                    conversation_manager.add_user_message(parsed_input.content)
                 response = await self.agent_manager.get_response(
-                    parsed_input.content, "conversational"
+                    parsed_input.content,
+                    "conversational",
+                    deterministic=deterministic,
+                    message_history=history,
                 )
+                if conversation_manager is not None:
+                    conversation_manager.add_assistant_message(response)
             elif parsed_input.mode == Mode.REPHRASING:
                 response = await self.agent_manager.get_response(
-                    parsed_input.content, "rephrasing"
+                    parsed_input.content, "rephrasing", deterministic=deterministic
                 )
             else:
                 return {
@@ -181,61 +216,137 @@ class DualModeAssistant:
                 "original_input": parsed_input.content,
             }
 
-    def process_single_request_sync(self, user_input: str) -> dict:
+    async def process_batch(
+        self,
+        inputs: list[str],
+        use_batch_api: bool = True,
+        max_concurrency: int = 16,
+    ) -> list[dict]:
+        """
+        Process many independent requests, grouped by mode.
+
+        With use_batch_api, same-mode requests are submitted through the
+        OpenAI Batch API (half token price, amortized HTTP overhead) and
+        results are stitched back into input order. Otherwise requests run
+        concurrently with a bounded fan-out.
+
+        Args:
+            inputs: The raw user inputs
+            use_batch_api: Whether to route groups through the Batch API
+            max_concurrency: Concurrency bound for the non-batch fallback
+
+        Returns:
+            Result dictionaries in the same order as inputs
+        """
+        if not use_batch_api:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def bounded(user_input: str) -> dict:
+                async with semaphore:
+                    return await self.process_single_request(user_input)
+
+            # Schedule every task before awaiting so the batch truly fans out
+            tasks = [asyncio.create_task(bounded(user_input)) for user_input in inputs]
+            return await asyncio.gather(*tasks)
+
+        results: list[dict | None] = [None] * len(inputs)
+        groups: dict[str, list[tuple[int, str]]] = {}
+
+        for index, user_input in enumerate(inputs):
+            parsed_input = self.input_parser.parse(user_input)
+            if not parsed_input.is_valid:
+                results[index] = {
+                    "success": False,
+                    "error": parsed_input.error_message,
+                    "mode": parsed_input.mode.value if parsed_input.mode else None,
+                }
+                continue
+            groups.setdefault(parsed_input.mode.value, []).append(
+                (index, parsed_input.content)
+            )
+
+        for mode, items in groups.items():
+            contents = [content for _, content in items]
+            try:
+                responses = await self.agent_manager.get_responses_batch_api(
+                    contents, mode
+                )
+                for (index, content), response in zip(items, responses, strict=True):
+                    results[index] = {
+                        "success": True,
+                        "response": response,
+                        "mode": mode,
+                        "original_input": content,
+                    }
+            except Exception as e:
+                for index, content in items:
+                    results[index] = {
+                        "success": False,
+                        "error": str(e),
+                        "mode": mode,
+                        "original_input": content,
+                    }
+
+        return results
+
+    def process_single_request_sync(
+        self, user_input: str, deterministic: bool = False
+    ) -> dict:
         """
         Process a single request and return the result (sync version for compatibility).
 
+        A thin wrapper over the async implementation so the two entry
+        points cannot drift apart.
+
         Args:
             user_input: The raw user input
+            deterministic: Whether the request may be served from the response cache
 
         Returns:
             Dictionary containing response data and metadata
+
+        Raises:
+            RuntimeError: If called from within a running event loop
         """
-        parsed_input = self.input_parser.parse(user_input)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.process_single_request(user_input, deterministic=deterministic)
+            )
+        raise RuntimeError(
+            "process_single_request_sync() cannot be used inside a running "
+            "event loop; await process_single_request() instead"
+        )
 
-        if not parsed_input.is_valid:
-            return {
-                "success": False,
-                "error": parsed_input.error_message,
-                "mode": parsed_input.mode.value if parsed_input.mode else None,
-            }
+    def close(self) -> None:
+        """
+        Release per-instance state so the assistant can be discarded.
 
-        try:
-            if parsed_input.mode == Mode.CONVERSATIONAL:
-                # For single requests, don't use conversation history
-                response = self.agent_manager.get_response_sync(
-                    parsed_input.content, "conversational"
-                )
-            elif parsed_input.mode == Mode.REPHRASING:
-                response = self.agent_manager.get_response_sync(
-                    parsed_input.content, "rephrasing"
-                )
-            else:
-                return {
-                    "success": False,
-                    "error": "Unsupported mode",
-                    "mode": parsed_input.mode.value,
-                }
+        Drops conversation history and cached responses; the shared HTTP
+        client and agents are process-wide and stay untouched.
+        """
+        self.conversation_manager.clear_history()
+        self.agent_manager.clear_cache()
 
-            return {
-                "success": True,
-                "response": response,
-                "mode": parsed_input.mode.value,
-                "original_input": parsed_input.content,
-            }
+    async def aclose(self) -> None:
+        """
+        Async counterpart of close() for event-loop callers.
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "mode": parsed_input.mode.value,
-                "original_input": parsed_input.content,
-            }
+        Exists so owners like the MCP server can release assistants during
+        shutdown/eviction without blocking the loop; the process-wide HTTP
+        client is closed at interpreter exit, not here.
+        """
+        self.close()
 
     def clear_conversation_history(self) -> None:
         """Clear the conversation history."""
         self.conversation_manager.clear_history()
 
+    def clear_cache(self) -> None:
+        """Clear the cached LLM responses."""
+        self.agent_manager.clear_cache()
+
     def get_conversation_stats(self) -> dict:
         """Get statistics about the current conversation."""
         return {
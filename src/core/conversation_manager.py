@@ -1,18 +1,83 @@
 """Conversation management utilities for maintaining chat history and context."""
 
+from collections import deque
+from typing import Literal
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
+
+# A single history entry: role, raw content, and its cached token count
+# so context trimming never re-encodes old messages
+Message = tuple[Literal["user", "assistant"], str, int]
+
+_ROLE_LABELS = {"user": "Human", "assistant": "AI"}
+
+# tiktoken is imported lazily on first use; when unavailable we fall back
+# to a cheap character-based estimate
+_ENCODER = None
+_ENCODER_FAILED = False
+
+
+def _count_tokens(text: str) -> int:
+    """
+    Count tokens for a message, caching the encoder after first use.
+
+    Args:
+        text: The message content
+
+    Returns:
+        Token count (estimated at ~4 chars/token if tiktoken is unavailable)
+    """
+    global _ENCODER, _ENCODER_FAILED
+    if _ENCODER is None and not _ENCODER_FAILED:
+        try:
+            import tiktoken
+
+            _ENCODER = tiktoken.encoding_for_model("gpt-4o")
+        except Exception:
+            _ENCODER_FAILED = True
+
+    if _ENCODER is not None:
+        return len(_ENCODER.encode(text))
+    return max(1, len(text) // 4)
+
+
+# Cached once so prompt assembly is a single join, not repeated f-string
+# formatting over the whole context
+_CTX_HEADER = "Previous conversation:\n"
+_CTX_FOOTER = "\n\nHuman: "
+
 
 class ConversationManager:
     """Manages conversation history and context for conversational mode."""
 
-    def __init__(self, max_history_pairs: int = 3):
+    def __init__(self, max_history_pairs: int = 3, max_context_tokens: int = 1500):
         """
         Initialize the conversation manager.
 
         Args:
             max_history_pairs: Maximum number of exchange pairs to keep in context
+            max_context_tokens: Token budget for serialized context; oldest
+                messages are dropped until the context fits
         """
         self.max_history_pairs = max_history_pairs
-        self._history: list[str] = []
+        self.max_context_tokens = max_context_tokens
+        # Bounded deque evicts the oldest messages in O(1), keeping memory
+        # constant regardless of session length
+        self._history: deque[Message] = deque(maxlen=max_history_pairs * 2)
+        # Latest message per role, tracked at insert so get_last_exchange
+        # is O(1) instead of a reverse scan
+        self._last_user: str | None = None
+        self._last_assistant: str | None = None
+        # Joined context memoized between mutations; reads far outnumber
+        # writes in the chat loop
+        self._context_cache: str | None = None
+        self._context_dirty: bool = True
 
     def add_user_message(self, message: str) -> None:
         """
@@ -21,7 +86,9 @@ class ConversationManager:
         Args:
             message: The user's message content
         """
-        self._history.append(f"Human: {message}")
+        self._history.append(("user", message, _count_tokens(message)))
+        self._last_user = message
+        self._context_dirty = True
 
     def add_assistant_message(self, message: str) -> None:
         """
@@ -30,27 +97,81 @@ class ConversationManager:
         Args:
             message: The assistant's response content
         """
-        self._history.append(f"AI: {message}")
+        self._history.append(("assistant", message, _count_tokens(message)))
+        self._last_assistant = message
+        self._context_dirty = True
+
+    def _budgeted_records(self) -> list[Message]:
+        """
+        Get the newest records whose combined token count fits the budget.
+
+        Returns:
+            History records in chronological order, trimmed from the front
+        """
+        records: list[Message] = []
+        budget = self.max_context_tokens
+
+        for record in reversed(self._history):
+            budget -= record[2]
+            if budget < 0:
+                break
+            records.append(record)
+
+        records.reverse()
+        return records
 
     def get_context(self) -> str | None:
         """
         Get the conversation context for the AI agent.
 
+        A single long response can blow the prompt up far past the message
+        bound, so the serialized context is additionally capped at
+        max_context_tokens using the token counts cached per message.
+
         Returns:
             Formatted conversation context string, or None if no history exists
         """
         if len(self._history) <= 1:
             return None
 
-        # Get the last few exchanges (max_history_pairs * 2 messages)
-        max_messages = self.max_history_pairs * 2
-        recent_history = self._history[-max_messages:]
+        if not self._context_dirty:
+            return self._context_cache
+
+        self._context_cache = "\n".join(
+            f"{_ROLE_LABELS[role]}: {content}"
+            for role, content, _ in self._budgeted_records()
+        )
+        self._context_dirty = False
+        return self._context_cache
+
+    def get_history_messages(self) -> list[ModelMessage]:
+        """
+        Get recent history as structured pydantic-ai messages.
 
-        return "\n".join(recent_history)
+        Passing these via message_history keeps the static system prompt
+        byte-identical across calls, which is what provider-side prompt
+        caching keys on.
+
+        Returns:
+            List of ModelRequest/ModelResponse messages for the agent
+        """
+        messages: list[ModelMessage] = []
+
+        for role, content, _ in self._budgeted_records():
+            if role == "user":
+                messages.append(ModelRequest(parts=[UserPromptPart(content=content)]))
+            else:
+                messages.append(ModelResponse(parts=[TextPart(content=content)]))
+
+        return messages
 
     def clear_history(self) -> None:
         """Clear the conversation history."""
         self._history.clear()
+        self._last_user = None
+        self._last_assistant = None
+        self._context_cache = None
+        self._context_dirty = True
 
     def get_history_length(self) -> int:
         """Get the number of messages in history."""
@@ -70,19 +191,7 @@ class ConversationManager:
         if len(self._history) < 2:
             return None, None
 
-        # Look for the last Human: and AI: pair
-        last_human = None
-        last_ai = None
-
-        for message in reversed(self._history):
-            if message.startswith("AI: ") and last_ai is None:
-                last_ai = message[4:]  # Remove "AI: " prefix
-            elif message.startswith("Human: ") and last_human is None:
-                last_human = message[7:]  # Remove "Human: " prefix
-                if last_ai is not None:
-                    break
-
-        return last_human, last_ai
+        return self._last_user, self._last_assistant
 
     def format_context_prompt(self, current_message: str) -> str:
         """
@@ -96,6 +205,6 @@ class ConversationManager:
         """
         context = self.get_context()
         if context:
-            return f"Previous conversation:\n{context}\n\nHuman: {current_message}"
+            return "".join((_CTX_HEADER, context, _CTX_FOOTER, current_message))
         else:
             return current_message
@@ -0,0 +1,180 @@
+"""Exact-match response caching for LLM calls."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+
+class CacheBackend(Protocol):
+    """Protocol for storage backends used by LLMCache."""
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        ...
+
+    def set(self, key: str, value: str, expire: int) -> None:
+        """Store value under key with an expiration time in seconds."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        ...
+
+
+class InMemoryBackend:
+    """In-memory cache backend with TTL and LRU eviction."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction kicks in
+        """
+        self.max_entries = max_entries
+        self._store: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+
+        # Mark as recently used
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, expire: int) -> None:
+        """Store value under key, evicting least-recently-used entries."""
+        self._store[key] = (value, time.monotonic() + expire)
+        self._store.move_to_end(key)
+
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._store.clear()
+
+
+class RedisBackend:
+    """Redis-backed cache backend built on the shared RedisCache helper."""
+
+    def __init__(self, cache=None) -> None:
+        """
+        Initialize the Redis backend.
+
+        Args:
+            cache: Optional RedisCache instance; created on demand if omitted
+        """
+        if cache is None:
+            from src.helpers.redis import RedisCache
+
+            cache = RedisCache()
+        self._cache = cache
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        return self._cache.get_cache_str(key)
+
+    def set(self, key: str, value: str, expire: int) -> None:
+        """Store value under key with an expiration time in seconds."""
+        self._cache.set_cache(key, value, expire)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._cache.clear_all()
+
+
+class LLMCache:
+    """
+    Exact-match response cache keyed on (model, mode, content, context).
+
+    A cache hit short-circuits the LLM round-trip entirely, so repeated
+    identical prompts (tests, demos, deterministic rephrasing) skip the
+    network call and token cost.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: int = 3600) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-memory LRU backend)
+            ttl: Time-to-live for cached responses in seconds
+        """
+        self.backend = backend if backend is not None else InMemoryBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        model: str, mode: str, content: str, context: str | None = None
+    ) -> str:
+        """
+        Build a deterministic cache key for a request.
+
+        Args:
+            model: The model name used for the request
+            mode: The assistant mode ('conversational' or 'rephrasing')
+            content: The user's input content
+            context: Optional conversation context
+
+        Returns:
+            A hex digest uniquely identifying the request
+        """
+        payload = json.dumps(
+            {"model": model, "mode": mode, "content": content, "context": context},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response, updating hit/miss stats.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached response if present, None otherwise
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key
+            value: The response to cache
+        """
+        self.backend.set(key, value, self.ttl)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset stats."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> dict:
+        """Get hit/miss statistics for the cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
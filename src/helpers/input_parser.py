@@ -1,5 +1,6 @@
 """Input parsing utilities for dual-mode AI assistant."""
 
+import re
 from dataclasses import dataclass
 from enum import Enum
 
@@ -26,10 +27,18 @@ class InputParser:
     """Handles parsing and validation of user input for different modes."""
 
     EXIT_COMMANDS = {"quit", "exit", "bye", "goodbye"}
+    # Longest exit command; inputs longer than this can't match, so we
+    # never lowercase a long rephrasing body just to test membership
+    _MAX_EXIT_LEN = max(map(len, EXIT_COMMANDS))
     MODE_PREFIXES = {
-        "conversational:": Mode.CONVERSATIONAL,
-        "rephrasing:": Mode.REPHRASING,
+        "conversational": Mode.CONVERSATIONAL,
+        "rephrasing": Mode.REPHRASING,
     }
+    # Single compiled DFA pass over the prefix; avoids lowercasing the
+    # entire input and looping over prefixes per call
+    _PREFIX_RE = re.compile(
+        r"^(conversational|rephrasing):\s*(.*)$", re.IGNORECASE | re.DOTALL
+    )
 
     @classmethod
     def parse(cls, user_input: str) -> ParsedInput:
@@ -44,8 +53,11 @@ class InputParser:
         """
         user_input = user_input.strip()
 
-        # Check for exit commands
-        if user_input.lower() in cls.EXIT_COMMANDS:
+        # Check for exit commands (length guard first: avoids an O(n)
+        # lowercased copy of the whole input for an O(1) membership test)
+        if len(user_input) <= cls._MAX_EXIT_LEN and (
+            user_input.lower() in cls.EXIT_COMMANDS
+        ):
             return ParsedInput(mode=Mode.HELP, content="exit", is_valid=True)
 
         # Check if input is empty
@@ -57,21 +69,22 @@ class InputParser:
                 error_message="I didn't catch that. Could you say something?",
             )
 
-        # Try to match mode prefixes
-        for prefix, mode in cls.MODE_PREFIXES.items():
-            if user_input.lower().startswith(prefix):
-                content = user_input[len(prefix) :].strip()
+        # Try to match a mode prefix
+        match = cls._PREFIX_RE.match(user_input)
+        if match:
+            mode = cls.MODE_PREFIXES[match.group(1).lower()]
+            content = match.group(2).strip()
 
-                # Validate that content exists after prefix
-                if not content:
-                    return ParsedInput(
-                        mode=mode,
-                        content="",
-                        is_valid=False,
-                        error_message="Please provide content after the mode label.",
-                    )
+            # Validate that content exists after prefix
+            if not content:
+                return ParsedInput(
+                    mode=mode,
+                    content="",
+                    is_valid=False,
+                    error_message="Please provide content after the mode label.",
+                )
 
-                return ParsedInput(mode=mode, content=content, is_valid=True)
+            return ParsedInput(mode=mode, content=content, is_valid=True)
 
         # No mode prefix found
         return ParsedInput(
@@ -84,7 +97,10 @@ class InputParser:
     @classmethod
     def is_exit_command(cls, user_input: str) -> bool:
         """Check if the input is an exit command."""
-        return user_input.strip().lower() in cls.EXIT_COMMANDS
+        stripped = user_input.strip()
+        return len(stripped) <= cls._MAX_EXIT_LEN and (
+            stripped.lower() in cls.EXIT_COMMANDS
+        )
 
     @classmethod
     def get_help_message(cls) -> str:
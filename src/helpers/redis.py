@@ -1,19 +1,118 @@
 """Redis cache utility for the dual-mode AI assistant."""
 
+import itertools
+import logging
 import os
+import threading
+from collections.abc import Iterator
 
+import orjson
 import redis
+import redis.asyncio
 from dotenv import load_dotenv
 from redis import Redis
 
+logger = logging.getLogger(__name__)
+# Library code shouldn't emit "No handler" warnings in unconfigured apps
+logger.addHandler(logging.NullHandler())
+
+# Parse .env once at import; constructing a RedisCache per request used to
+# re-open and re-parse the file every time
+load_dotenv()
+
+# One shared connection pool for the whole process: sockets (and their
+# TCP/AUTH setup cost) are reused across RedisCache instances and threads
+_POOL: redis.ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> redis.ConnectionPool:
+    """
+    Build the shared connection pool on first use.
+
+    Returns:
+        The process-wide Redis connection pool
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = redis.ConnectionPool(
+                    host=os.environ.get("REDIS_HOST", "localhost"),
+                    username=os.environ.get("REDIS_USERNAME"),
+                    password=os.environ.get("REDIS_PASSWORD"),
+                    port=int(os.environ.get("REDIS_PORT", "6379")),
+                    db=int(os.environ.get("REDIS_DB", "0")),
+                    max_connections=32,
+                    # Replies stay bytes; decoding every reply to str is
+                    # wasted work for binary/JSON payloads and the decode
+                    # dominates per-op cost for large values
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+    return _POOL
+
+
+def disconnect_pool() -> None:
+    """Disconnect the shared pool; intended for process shutdown."""
+    if _POOL is not None:
+        _POOL.disconnect()
+
+
+# A small ring of clients over the shared pool, handed out round-robin so
+# concurrent RedisCache instances don't all queue behind one client object.
+# Sized from REDIS_POOL_SIZE; beyond ~8 extra clients rarely help.
+_CLIENTS: list[Redis] | None = None
+_CLIENT_CYCLE: Iterator[Redis] | None = None
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _next_client() -> Redis:
+    """
+    Get the next client from the round-robin ring, building it on first use.
+
+    Returns:
+        A Redis client backed by the shared connection pool
+    """
+    global _CLIENTS, _CLIENT_CYCLE
+    if _CLIENT_CYCLE is None:
+        pool = _get_pool()
+        with _CLIENTS_LOCK:
+            if _CLIENT_CYCLE is None:
+                size = int(
+                    os.environ.get("REDIS_POOL_SIZE", min(os.cpu_count() or 4, 8))
+                )
+                _CLIENTS = [
+                    redis.Redis(connection_pool=pool) for _ in range(max(1, size))
+                ]
+                _CLIENT_CYCLE = itertools.cycle(_CLIENTS)
+    return next(_CLIENT_CYCLE)
+
+
+def session_key(session_id: str, suffix: str) -> str:
+    """
+    Build a session-scoped key with a Redis Cluster hash tag.
+
+    The braces force every key of one session onto the same cluster slot,
+    so multi-key commands and pipelines over a session keep working (no
+    CROSSSLOT) if the cache moves to cluster mode.
+
+    Args:
+        session_id: Session identifier
+        suffix: Key suffix within the session namespace
+
+    Returns:
+        The namespaced cache key
+    """
+    return f"session:{{{session_id}}}:{suffix}"
+
 
 class RedisCache:
     """Redis cache manager with environment-based configuration."""
 
     def __init__(self) -> None:
         """Initialize Redis cache with environment variables."""
-        load_dotenv()
-
         # Load Redis configuration from environment
         self.host = os.environ.get("REDIS_HOST", "localhost")
         self.username = os.environ.get("REDIS_USERNAME")
@@ -21,47 +120,31 @@ class RedisCache:
         self.port = int(os.environ.get("REDIS_PORT", "6379"))
         self.db = int(os.environ.get("REDIS_DB", "0"))
 
-        # Initialize connection
-        self._client: Redis | None = self.connect()
+        # Bind the pool-backed client directly; hot methods skip the extra
+        # property dispatch and None check per operation
+        self._client: Redis = self.connect()
 
     def connect(self) -> Redis:
         """
-        Create and return a Redis connection.
+        Get a pool-backed Redis client, rotated round-robin per caller.
+
+        The pool hands out established sockets, so there's no connect/AUTH
+        round-trip here; rotating through a small client ring spreads
+        concurrent instances across parallel TCP streams.
 
         Returns:
             Redis client instance
-
-        Raises:
-            redis.ConnectionError: If connection fails
         """
-        try:
-            client = redis.Redis(
-                host=self.host,
-                username=self.username,
-                password=self.password,
-                port=self.port,
-                db=self.db,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-            )
-
-            # Test the connection
-            client.ping()
-            return client
-        except redis.ConnectionError as e:
-            raise redis.ConnectionError(f"Failed to connect to Redis: {e}") from e
+        return _next_client()
 
     @property
     def client(self) -> Redis:
         """
-        Get the Redis client, creating connection if needed.
+        Get the Redis client (kept for existing callers).
 
         Returns:
             Redis client instance
         """
-        if self._client is None:
-            self._client = self.connect()
         return self._client
 
     def set_cache(self, key: str, value: str, expire: int = 3600) -> bool:
@@ -77,29 +160,246 @@ class RedisCache:
             True if successful, False otherwise
         """
         try:
-            result = self.client.setex(key, expire, value)
-            return bool(result)
-        except Exception as e:
-            print(f"Error setting cache: {e}")
+            return bool(self._client.setex(key, expire, value))
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                return bool(self._client.setex(key, expire, value))
+            except Exception:
+                logger.exception("Error setting cache")
+                return False
+        except Exception:
+            logger.exception("Error setting cache")
             return False
 
-    def get_cache(self, key: str) -> str | None:
+    def next_id(self, key: str = "url:seq") -> int | None:
         """
-        Get a cache value by key.
+        Get the next value of a monotonically increasing counter.
+
+        INCR is atomic server-side, so the returned id is unique across
+        every client without any collision checking.
+
+        Args:
+            key: Counter key (default: the URL-shortener sequence)
+
+        Returns:
+            The incremented counter value, or None on error
+        """
+        try:
+            return int(self._client.incr(key))
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                return int(self._client.incr(key))
+            except Exception:
+                logger.exception("Error incrementing counter")
+                return None
+        except Exception:
+            logger.exception("Error incrementing counter")
+            return None
+
+    def reserve_ids(self, count: int, key: str = "url:seq") -> int | None:
+        """
+        Atomically reserve a contiguous range of counter ids.
+
+        One INCRBY claims `count` ids in a single round-trip; the caller
+        owns [first, first + count).
+
+        Args:
+            count: How many ids to reserve
+            key: Counter key (default: the URL-shortener sequence)
+
+        Returns:
+            The first id of the reserved range, or None on error
+        """
+        try:
+            end = int(self._client.incrby(key, count))
+            return end - count + 1
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                end = int(self._client.incrby(key, count))
+                return end - count + 1
+            except Exception:
+                logger.exception("Error reserving counter range")
+                return None
+        except Exception:
+            logger.exception("Error reserving counter range")
+            return None
+
+    def set_if_absent(self, key: str, value: str, expire: int = 3600) -> bool:
+        """
+        Set a cache value only if the key does not exist (atomic SET NX).
+
+        One round-trip replaces the GET-then-SET pattern and closes its
+        check-then-act race: Redis reports the collision directly.
 
         Args:
             key: Cache key
+            value: Cache value
+            expire: Expiration time in seconds (default: 1 hour)
 
         Returns:
-            Cache value if exists, None otherwise
+            True if the key was set, False if it already existed or on error
         """
         try:
-            result = self.client.get(key)
-            return result if isinstance(result, str) else None
-        except Exception as e:
-            print(f"Error getting cache: {e}")
+            return bool(self._client.set(key, value, nx=True, ex=expire))
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                return bool(self._client.set(key, value, nx=True, ex=expire))
+            except Exception:
+                logger.exception("Error setting cache")
+                return False
+        except Exception:
+            logger.exception("Error setting cache")
+            return False
+
+    def get_cache(self, key: str) -> bytes | None:
+        """
+        Get a raw cache value by key.
+
+        Values are returned as bytes; decode lazily (or use get_cache_str)
+        only where text is actually needed.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw cache value if exists, None otherwise
+        """
+        try:
+            return self._client.get(key)
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                return self._client.get(key)
+            except Exception:
+                logger.exception("Error getting cache")
+                return None
+        except Exception:
+            logger.exception("Error getting cache")
+            return None
+
+    def get_cache_str(self, key: str) -> str | None:
+        """
+        Get a cache value decoded as UTF-8 text.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded cache value if exists, None otherwise
+        """
+        result = self.get_cache(key)
+        return result.decode("utf-8") if result is not None else None
+
+    def set_obj(self, key: str, obj: object, expire: int = 3600) -> bool:
+        """
+        Store a structured value serialized as compact orjson bytes.
+
+        Binary payloads are smaller and faster to encode than json.dumps
+        text, which cuts network bandwidth and Redis memory for cached
+        structured responses.
+
+        Args:
+            key: Cache key
+            obj: JSON-serializable value to store
+            expire: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return bool(self._client.setex(key, expire, orjson.dumps(obj)))
+        except Exception:
+            logger.exception("Error setting object cache")
+            return False
+
+    def get_obj(self, key: str) -> object | None:
+        """
+        Get a structured value stored with set_obj.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Deserialized value if it exists, None otherwise
+        """
+        raw = self.get_cache(key)
+        if raw is None:
+            return None
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.exception("Corrupt object cache entry for %s", key)
             return None
 
+    def mset_cache(self, mapping: dict[str, str], expire: int = 3600) -> bool:
+        """
+        Set many cache values in a single round-trip.
+
+        All SETEX commands are queued on one non-transactional pipeline and
+        flushed with a single execute(), so N keys cost one network RTT
+        instead of N.
+
+        Args:
+            mapping: Key/value pairs to store
+            expire: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            True if every key was set, False otherwise
+        """
+        if not mapping:
+            return True
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, expire, value)
+            return all(bool(result) for result in pipe.execute())
+        except Exception:
+            logger.exception("Error batch-setting cache")
+            return False
+
+    def mget_cache(self, keys: list[str]) -> list[bytes | None]:
+        """
+        Get many raw cache values in a single round-trip.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Raw values in key order, with None for missing keys
+        """
+        if not keys:
+            return []
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipe.get(key)
+            return pipe.execute()
+        except Exception:
+            logger.exception("Error batch-getting cache")
+            return [None] * len(keys)
+
+    def mdelete_cache(self, keys: list[str]) -> int:
+        """
+        Delete many cache keys with one variadic DEL command.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of keys actually deleted
+        """
+        if not keys:
+            return 0
+        try:
+            return int(self._client.delete(*keys))
+        except Exception:
+            logger.exception("Error batch-deleting cache")
+            return 0
+
     def delete_cache(self, key: str) -> bool:
         """
         Delete a cache key.
@@ -111,25 +411,64 @@ class RedisCache:
             True if key was deleted, False otherwise
         """
         try:
-            return bool(self.client.delete(key))
-        except Exception as e:
-            print(f"Error deleting cache: {e}")
+            return bool(self._client.delete(key))
+        except redis.ConnectionError:
+            try:
+                self._client = self.connect()
+                return bool(self._client.delete(key))
+            except Exception:
+                logger.exception("Error deleting cache")
+                return False
+        except Exception:
+            logger.exception("Error deleting cache")
             return False
 
     def clear_all(self) -> bool:
         """
         Clear all cache data.
 
+        The flush runs in a Redis background thread (FLUSHDB ASYNC), so a
+        large keyspace no longer stalls every other client while it's freed.
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            result = self.client.flushdb()
+            result = self._client.flushdb(asynchronous=True)
             return bool(result)
-        except Exception as e:
-            print(f"Error clearing cache: {e}")
+        except Exception:
+            logger.exception("Error clearing cache")
             return False
 
+    def clear_prefix(self, prefix: str, batch: int = 500) -> int:
+        """
+        Delete all keys matching a prefix without blocking the server.
+
+        Keys are discovered incrementally with SCAN and removed in
+        pipelined UNLINK batches; UNLINK hands the actual memory freeing to
+        a Redis background thread.
+
+        Args:
+            prefix: Key prefix to match (a trailing * is appended)
+            batch: SCAN count hint and pipeline flush size
+
+        Returns:
+            Number of keys queued for deletion
+        """
+        deleted = 0
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key in self._client.scan_iter(match=f"{prefix}*", count=batch):
+                pipe.unlink(key)
+                deleted += 1
+                if deleted % batch == 0:
+                    pipe.execute()
+            pipe.execute()
+            return deleted
+        except Exception:
+            logger.exception("Error clearing cache prefix")
+            return deleted
+
     def is_connected(self) -> bool:
         """
         Check if Redis connection is active.
@@ -138,15 +477,206 @@ class RedisCache:
             True if connected, False otherwise
         """
         try:
-            if self._client is None:
-                return False
             self._client.ping()
             return True
         except Exception:
             return False
 
     def close(self) -> None:
-        """Close the Redis connection."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """No-op for pool-backed clients; use disconnect_pool() at shutdown."""
+
+
+# Async mirror of the shared pool for event-loop callers
+_ASYNC_POOL: redis.asyncio.ConnectionPool | None = None
+_ASYNC_POOL_LOCK = threading.Lock()
+
+
+def _get_async_pool() -> redis.asyncio.ConnectionPool:
+    """
+    Build the shared async connection pool on first use.
+
+    Returns:
+        The process-wide asyncio Redis connection pool
+    """
+    global _ASYNC_POOL
+    if _ASYNC_POOL is None:
+        with _ASYNC_POOL_LOCK:
+            if _ASYNC_POOL is None:
+                _ASYNC_POOL = redis.asyncio.ConnectionPool(
+                    host=os.environ.get("REDIS_HOST", "localhost"),
+                    username=os.environ.get("REDIS_USERNAME"),
+                    password=os.environ.get("REDIS_PASSWORD"),
+                    port=int(os.environ.get("REDIS_PORT", "6379")),
+                    db=int(os.environ.get("REDIS_DB", "0")),
+                    max_connections=32,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+    return _ASYNC_POOL
+
+
+async def disconnect_async_pool() -> None:
+    """Disconnect the shared async pool; intended for process shutdown."""
+    if _ASYNC_POOL is not None:
+        await _ASYNC_POOL.disconnect()
+
+
+class AsyncRedisCache:
+    """
+    Async Redis cache with the same method surface as RedisCache.
+
+    Built on redis.asyncio so calls from coroutine handlers yield to the
+    event loop during network IO instead of blocking it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the async cache over the shared async pool."""
+        self._client = redis.asyncio.Redis(connection_pool=_get_async_pool())
+
+    async def set_cache(self, key: str, value: str, expire: int = 3600) -> bool:
+        """
+        Set a cache value with expiration.
+
+        Args:
+            key: Cache key
+            value: Cache value
+            expire: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return bool(await self._client.setex(key, expire, value))
+        except Exception:
+            logger.exception("Error setting cache")
+            return False
+
+    async def get_cache(self, key: str) -> bytes | None:
+        """
+        Get a raw cache value by key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw cache value if exists, None otherwise
+        """
+        try:
+            return await self._client.get(key)
+        except Exception:
+            logger.exception("Error getting cache")
+            return None
+
+    async def get_cache_str(self, key: str) -> str | None:
+        """
+        Get a cache value decoded as UTF-8 text.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded cache value if exists, None otherwise
+        """
+        result = await self.get_cache(key)
+        return result.decode("utf-8") if result is not None else None
+
+    async def set_obj(self, key: str, obj: object, expire: int = 3600) -> bool:
+        """
+        Store a structured value serialized as compact orjson bytes.
+
+        Args:
+            key: Cache key
+            obj: JSON-serializable value to store
+            expire: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return bool(await self._client.setex(key, expire, orjson.dumps(obj)))
+        except Exception:
+            logger.exception("Error setting object cache")
+            return False
+
+    async def get_obj(self, key: str) -> object | None:
+        """
+        Get a structured value stored with set_obj.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Deserialized value if it exists, None otherwise
+        """
+        raw = await self.get_cache(key)
+        if raw is None:
+            return None
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.exception("Corrupt object cache entry for %s", key)
+            return None
+
+    async def mset_cache(self, mapping: dict[str, str], expire: int = 3600) -> bool:
+        """
+        Set many cache values in a single round-trip.
+
+        Args:
+            mapping: Key/value pairs to store
+            expire: Expiration time in seconds (default: 1 hour)
+
+        Returns:
+            True if every key was set, False otherwise
+        """
+        if not mapping:
+            return True
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, expire, value)
+                results = await pipe.execute()
+            return all(bool(result) for result in results)
+        except Exception:
+            logger.exception("Error batch-setting cache")
+            return False
+
+    async def mget_cache(self, keys: list[str]) -> list[bytes | None]:
+        """
+        Get many raw cache values in a single round-trip.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Raw values in key order, with None for missing keys
+        """
+        if not keys:
+            return []
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                return await pipe.execute()
+        except Exception:
+            logger.exception("Error batch-getting cache")
+            return [None] * len(keys)
+
+    async def delete_cache(self, key: str) -> bool:
+        """
+        Delete a cache key.
+
+        Args:
+            key: Cache key to delete
+
+        Returns:
+            True if key was deleted, False otherwise
+        """
+        try:
+            return bool(await self._client.delete(key))
+        except Exception:
+            logger.exception("Error deleting cache")
+            return False
+
+    async def aclose(self) -> None:
+        """No-op for pool-backed clients; use disconnect_async_pool() at shutdown."""
@@ -1,6 +1,30 @@
 """UI helper utilities for displaying messages and formatting output."""
 
 import asyncio
+import sys
+
+# Assembled once at import; the banner never changes between calls
+_WELCOME = (
+    "🤖 " + "=" * 65 + "\n"
+    "   Welcome to your Dual-Mode AI Assistant!\n"
+    "\n"
+    "   I have two operating modes:\n"
+    "   1. CONVERSATIONAL: Start with 'conversational:' for friendly chat\n"
+    "   2. REPHRASING: Start with 'rephrasing:' for grammar/text improvement\n"
+    "\n"
+    "   Examples:\n"
+    "   • conversational: How do neural networks work?\n"
+    "   • rephrasing: I went to store yesterday and buy some food\n"
+    "\n"
+    "   Type 'quit', 'exit', or 'bye' to end our conversation.\n" + "=" * 68 + "\n\n"
+)
+
+_HELP = (
+    "🤖 Please specify a mode to get started:\n"
+    "   • Type 'conversational: [your message]' for friendly chat\n"
+    "   • Type 'rephrasing: [your text]' for grammar/text help\n"
+    "\n"
+)
 
 
 class UIHelper:
@@ -9,20 +33,7 @@ class UIHelper:
     @staticmethod
     def print_welcome() -> None:
         """Print a friendly welcome message."""
-        print("🤖 " + "=" * 65)
-        print("   Welcome to your Dual-Mode AI Assistant!")
-        print()
-        print("   I have two operating modes:")
-        print("   1. CONVERSATIONAL: Start with 'conversational:' for friendly chat")
-        print("   2. REPHRASING: Start with 'rephrasing:' for grammar/text improvement")
-        print()
-        print("   Examples:")
-        print("   • conversational: How do neural networks work?")
-        print("   • rephrasing: I went to store yesterday and buy some food")
-        print()
-        print("   Type 'quit', 'exit', or 'bye' to end our conversation.")
-        print("=" * 68)
-        print()
+        sys.stdout.write(_WELCOME)
 
     @staticmethod
     def print_goodbye() -> None:
@@ -32,10 +43,7 @@ class UIHelper:
     @staticmethod
     def print_help() -> None:
         """Print help message for mode usage."""
-        print("🤖 Please specify a mode to get started:")
-        print("   • Type 'conversational: [your message]' for friendly chat")
-        print("   • Type 'rephrasing: [your text]' for grammar/text help")
-        print()
+        sys.stdout.write(_HELP)
 
     @staticmethod
     def print_error(message: str) -> None:
@@ -0,0 +1,642 @@
+"""MCP server exposing the dual-mode AI assistant over the Model Context Protocol."""
+
+import asyncio
+import io
+import logging
+import os
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+import orjson
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import (
+    GetPromptResult,
+    Prompt,
+    PromptArgument,
+    PromptMessage,
+    Resource,
+    TextContent,
+    Tool,
+)
+
+from src.core.assistant import DualModeAssistant
+from src.core.conversation_manager import ConversationManager
+from src.helpers.redis import AsyncRedisCache, session_key
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Mode prefixes the input parser expects, hoisted so per-call request
+# assembly is a single concat
+PREFIX_CONV = "conversational: "
+PREFIX_REPHRASE = "rephrasing: "
+
+_DEFAULT_MODEL = "openai:gpt-4o"
+
+# Rephrase requests arriving within this window coalesce into one LLM
+# call; the window is a small fixed cost traded for fewer round-trips
+_REPHRASE_BATCH_WINDOW = 0.02
+_REPHRASE_BATCH_MAX = 8
+
+_NUMBERED_LINE_RE = re.compile(r"^\s*(\d+)[.)]\s*(.*)$")
+
+# Tool input schemas, hoisted so the dict/str literals are allocated once
+# at import rather than per Tool construction
+_SCHEMA_CONV_CHAT = {
+    "type": "object",
+    "properties": {
+        "message": {
+            "type": "string",
+            "description": "The message to send to the assistant",
+        },
+        "session_id": {
+            "type": "string",
+            "description": "Session identifier (default: 'default')",
+        },
+    },
+    "required": ["message"],
+}
+_SCHEMA_REPHRASE = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "type": "string",
+            "description": "The text to rephrase",
+        },
+    },
+    "required": ["text"],
+}
+_SCHEMA_SESSION_OPTIONAL = {
+    "type": "object",
+    "properties": {
+        "session_id": {
+            "type": "string",
+            "description": "Session identifier (default: 'default')",
+        },
+    },
+}
+_SCHEMA_CREATE_SESSION = {
+    "type": "object",
+    "properties": {
+        "session_id": {
+            "type": "string",
+            "description": "Identifier for the new session",
+        },
+    },
+    "required": ["session_id"],
+}
+_SCHEMA_EMPTY = {"type": "object", "properties": {}}
+_SCHEMA_BATCH_CALL = {
+    "type": "object",
+    "properties": {
+        "calls": {
+            "type": "array",
+            "description": "Tool invocations to run concurrently",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "arguments": {"type": "object"},
+                },
+                "required": ["name"],
+            },
+        },
+    },
+    "required": ["calls"],
+}
+
+# Fixed error replies built once; these lists are returned as-is, never mutated
+_ERR_NO_MESSAGE = [TextContent(type="text", text="Error: 'message' is required")]
+_ERR_NO_TEXT = [TextContent(type="text", text="Error: 'text' is required")]
+_ERR_NO_SESSION_ID = [TextContent(type="text", text="Error: 'session_id' is required")]
+_ERR_NO_CALLS = [TextContent(type="text", text="Error: 'calls' is required")]
+
+
+@dataclass(slots=True)
+class ConversationSession:
+    """State and metadata for one MCP conversation session."""
+
+    session_id: str
+    model_name: str
+    conversation: ConversationManager
+    created_at: str
+    message_count: int = 0
+
+
+class PydanticAIMCPServer:
+    """MCP server wrapping the dual-mode assistant for MCP clients."""
+
+    def __init__(self) -> None:
+        """Initialize the server, session store, and protocol handlers."""
+        self.server = Server("conversational-ai")
+        # LRU-ordered and capped: every unknown session_id creates an
+        # assistant with its own history, so an unbounded dict grows for
+        # the life of the server
+        self.sessions: OrderedDict[str, ConversationSession] = OrderedDict()
+        self._max_sessions = int(os.environ.get("MCP_MAX_SESSIONS", 1024))
+        # One assistant per model: sessions only carry history, so model
+        # clients, agents, and prompts aren't duplicated per session
+        self._assistants: dict[str, DualModeAssistant] = {}
+        # Per-session creation locks so concurrent first calls for one
+        # session_id build a single session; the guard lock only protects
+        # lock-dict insertion
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._locks_guard = asyncio.Lock()
+        # Micro-batching queue for rephrase requests; the worker task is
+        # started in run() once the event loop exists
+        self._rephrase_queue: asyncio.Queue[tuple[str, asyncio.Future[str]]] = (
+            asyncio.Queue()
+        )
+        self._rephrase_worker: asyncio.Task | None = None
+        # Async client so session-metadata writes yield to other tool calls
+        # instead of blocking the event loop on Redis round-trips
+        self.session_cache = AsyncRedisCache()
+        # Built once; the list_* handlers are called per MCP request and
+        # rebuilding these Pydantic models each time is pure overhead
+        self._tools = self._build_tools()
+        self._prompts = self._build_prompts()
+        self._resources: list[Resource] = []
+        # O(1) tool dispatch; new tools register here instead of growing a
+        # branch chain in handle_call_tool
+        self._tool_handlers = {
+            "conversational_chat": self._handle_conversational_chat,
+            "rephrase_text": self._handle_rephrase_text,
+            "get_conversation_stats": self._handle_get_stats,
+            "clear_conversation_history": self._handle_clear_history,
+            "create_session": self._handle_create_session,
+            "list_sessions": self._handle_list_sessions,
+            "batch_call": self._handle_batch_call,
+        }
+        self._register_handlers()
+
+    @staticmethod
+    def _build_tools() -> list[Tool]:
+        """Build the static tool list advertised to clients."""
+        return [
+            Tool(
+                name="conversational_chat",
+                description="Chat with the AI assistant, keeping per-session history",
+                inputSchema=_SCHEMA_CONV_CHAT,
+            ),
+            Tool(
+                name="rephrase_text",
+                description="Rephrase text to improve clarity and grammar",
+                inputSchema=_SCHEMA_REPHRASE,
+            ),
+            Tool(
+                name="get_conversation_stats",
+                description="Get statistics for a conversation session",
+                inputSchema=_SCHEMA_SESSION_OPTIONAL,
+            ),
+            Tool(
+                name="clear_conversation_history",
+                description="Clear the conversation history for a session",
+                inputSchema=_SCHEMA_SESSION_OPTIONAL,
+            ),
+            Tool(
+                name="create_session",
+                description="Create a new named conversation session",
+                inputSchema=_SCHEMA_CREATE_SESSION,
+            ),
+            Tool(
+                name="list_sessions",
+                description="List all active conversation sessions",
+                inputSchema=_SCHEMA_EMPTY,
+            ),
+            Tool(
+                name="batch_call",
+                description="Run several independent tool calls concurrently",
+                inputSchema=_SCHEMA_BATCH_CALL,
+            ),
+        ]
+
+    @staticmethod
+    def _build_prompts() -> list[Prompt]:
+        """Build the static prompt list advertised to clients."""
+        return [
+            Prompt(
+                name="rephrase",
+                description="Rephrase the given text for clarity",
+                arguments=[
+                    PromptArgument(
+                        name="text",
+                        description="The text to rephrase",
+                        required=True,
+                    ),
+                ],
+            ),
+        ]
+
+    def _register_handlers(self) -> None:
+        """Register tool, prompt, and resource handlers with the MCP server."""
+
+        @self.server.list_tools()
+        async def handle_list_tools() -> list[Tool]:
+            return self._tools
+
+        @self.server.call_tool()
+        async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+            return await self._dispatch(name, arguments)
+
+        @self.server.list_prompts()
+        async def handle_list_prompts() -> list[Prompt]:
+            return self._prompts
+
+        @self.server.get_prompt()
+        async def handle_get_prompt(
+            name: str, arguments: dict | None
+        ) -> GetPromptResult:
+            if name != "rephrase":
+                raise ValueError(f"Unknown prompt: {name}")
+            text = (arguments or {}).get("text", "")
+            return GetPromptResult(
+                description="Rephrase the given text for clarity",
+                messages=[
+                    PromptMessage(
+                        role="user",
+                        content=TextContent(type="text", text=PREFIX_REPHRASE + text),
+                    ),
+                ],
+            )
+
+        @self.server.list_resources()
+        async def handle_list_resources() -> list[Resource]:
+            return self._resources
+
+    async def _dispatch(self, name: str, arguments: dict) -> list[TextContent]:
+        """
+        Route a tool invocation to its handler.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            The handler's reply, or an error reply for unknown tools
+        """
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return [TextContent(type="text", text=f"Error: unknown tool '{name}'")]
+        return await handler(arguments)
+
+    async def _handle_batch_call(self, arguments: dict) -> list[TextContent]:
+        """
+        Run many independent tool calls concurrently.
+
+        The batch completes in the wall time of its slowest member instead
+        of the sum; failures are reported per index without cancelling the
+        rest.
+        """
+        calls = arguments.get("calls")
+        if not calls:
+            return _ERR_NO_CALLS
+
+        tasks = [
+            asyncio.create_task(
+                self._dispatch(call.get("name", ""), call.get("arguments", {}))
+            )
+            for call in calls
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        payload = []
+        for idx, result in enumerate(results):
+            if isinstance(result, BaseException):
+                payload.append({"idx": idx, "ok": False, "text": str(result)})
+            else:
+                payload.append(
+                    {
+                        "idx": idx,
+                        "ok": True,
+                        "text": "\n".join(part.text for part in result),
+                    }
+                )
+        return [
+            TextContent(
+                type="text",
+                text=orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode(),
+            )
+        ]
+
+    async def _get_or_create_session(self, session_id: str) -> ConversationSession:
+        """
+        Get an existing session or lazily create one.
+
+        Creation is serialized per session_id so concurrent first calls
+        don't race and build duplicate sessions.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The session for session_id
+        """
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            async with self._locks_guard:
+                lock = self._session_locks.setdefault(session_id, asyncio.Lock())
+
+        async with lock:
+            # Double-check: another call may have created it while we waited
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = ConversationSession(
+                    session_id=session_id,
+                    model_name=_DEFAULT_MODEL,
+                    conversation=ConversationManager(),
+                    created_at=datetime.now().isoformat(),
+                )
+                self.sessions[session_id] = session
+                self._evict_over_limit()
+                # Lazy %s form: no string formatting unless INFO is enabled
+                logger.info("Created new session: %s", session_id)
+        # The lock only guards first-time creation; drop it so the dict
+        # doesn't keep one entry per session_id ever seen (late waiters
+        # still hold their reference and find the session on double-check)
+        self._session_locks.pop(session_id, None)
+        return session
+
+    def _assistant_for(self, model_name: str) -> DualModeAssistant:
+        """
+        Get the shared assistant for a model, creating it on first use.
+
+        Args:
+            model_name: The model identifier
+
+        Returns:
+            The process-wide assistant for model_name
+        """
+        assistant = self._assistants.get(model_name)
+        if assistant is None:
+            assistant = self._assistants.setdefault(
+                model_name, DualModeAssistant(model_name=model_name)
+            )
+        return assistant
+
+    def _evict_over_limit(self) -> None:
+        """Evict least-recently-used sessions beyond the configured cap."""
+        while len(self.sessions) > self._max_sessions:
+            _, evicted = self.sessions.popitem(last=False)
+            evicted.conversation.clear_history()
+
+    async def _handle_conversational_chat(self, arguments: dict) -> list[TextContent]:
+        """Run a conversational turn inside the requested session."""
+        message = arguments.get("message")
+        if not message:
+            return _ERR_NO_MESSAGE
+
+        session = await self._get_or_create_session(
+            arguments.get("session_id", "default")
+        )
+        assistant = self._assistant_for(session.model_name)
+
+        # The metadata write doesn't depend on the model output, so it
+        # overlaps the LLM round-trip instead of adding to it
+        session.message_count += 1
+        result, _ = await asyncio.gather(
+            assistant.process_single_request(
+                PREFIX_CONV + message, conversation_manager=session.conversation
+            ),
+            self.session_cache.set_cache(
+                session_key(session.session_id, "message_count"),
+                str(session.message_count),
+            ),
+        )
+        if not result["success"]:
+            return [TextContent(type="text", text=f"Error: {result['error']}")]
+        return [TextContent(type="text", text=result["response"])]
+
+    async def _handle_rephrase_text(self, arguments: dict) -> list[TextContent]:
+        """Rephrase text, coalescing concurrent requests into one LLM call."""
+        text = arguments.get("text")
+        if not text:
+            return _ERR_NO_TEXT
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        worker = self._rephrase_worker
+        # Two cases bypass the queue: multi-line text (the numbered-line
+        # batch framing can't represent items that span lines) and a
+        # missing or dead worker (run() not called, or the worker
+        # crashed) — queueing then would park the future forever
+        if "\n" in text or worker is None or worker.done():
+            await self._run_rephrase_batch([(text, future)])
+        else:
+            await self._rephrase_queue.put((text, future))
+        try:
+            response = await future
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        return [TextContent(type="text", text=response)]
+
+    async def _rephrase_batch_worker(self) -> None:
+        """Drain the rephrase queue, batching items that arrive together."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = [await self._rephrase_queue.get()]
+                deadline = loop.time() + _REPHRASE_BATCH_WINDOW
+                while len(batch) < _REPHRASE_BATCH_MAX:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._rephrase_queue.get(), timeout)
+                        )
+                    except TimeoutError:
+                        break
+                try:
+                    await self._run_rephrase_batch(batch)
+                except Exception as e:
+                    # A failed batch must not kill the worker: every later
+                    # rephrase call would await a future nobody resolves
+                    logger.exception("Rephrase batch failed")
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(RuntimeError(str(e)))
+        finally:
+            # Fail anything still queued so no caller is left awaiting a
+            # future that will never resolve
+            while not self._rephrase_queue.empty():
+                _, future = self._rephrase_queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("rephrase worker stopped"))
+
+    async def _run_rephrase_batch(
+        self, batch: list[tuple[str, asyncio.Future[str]]]
+    ) -> None:
+        """Rephrase a batch with one LLM call and resolve the waiting futures."""
+        assistant = self._assistant_for(_DEFAULT_MODEL)
+
+        if len(batch) == 1:
+            text, future = batch[0]
+            result = await assistant.process_single_request(PREFIX_REPHRASE + text)
+            if future.done():
+                return
+            if result["success"]:
+                future.set_result(result["response"])
+            else:
+                future.set_exception(RuntimeError(result["error"]))
+            return
+
+        numbered = "\n".join(
+            f"{index + 1}. {text}" for index, (text, _) in enumerate(batch)
+        )
+        prompt = (
+            "Rephrase each numbered line independently. Reply with the same "
+            f"numbering, one line per item:\n{numbered}"
+        )
+        result = await assistant.process_single_request(PREFIX_REPHRASE + prompt)
+
+        if not result["success"]:
+            error = RuntimeError(result["error"])
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        rephrased: dict[int, str] = {}
+        for line in result["response"].splitlines():
+            match = _NUMBERED_LINE_RE.match(line)
+            if match:
+                rephrased[int(match.group(1))] = match.group(2)
+
+        for index, (text, future) in enumerate(batch):
+            if future.done():
+                continue
+            # Fall back to the original text if the model dropped a line
+            future.set_result(rephrased.get(index + 1, text))
+
+    async def _handle_get_stats(self, arguments: dict) -> list[TextContent]:
+        """Return conversation statistics for a session as JSON."""
+        session = await self._get_or_create_session(
+            arguments.get("session_id", "default")
+        )
+        stats = {
+            "message_count": session.conversation.get_history_length(),
+            "has_context": session.conversation.has_context(),
+        }
+        stats["session_id"] = session.session_id
+        stats["created_at"] = session.created_at
+        stats["tool_calls"] = session.message_count
+        return [
+            TextContent(
+                type="text",
+                text=orjson.dumps(stats, option=orjson.OPT_INDENT_2).decode(),
+            )
+        ]
+
+    async def _handle_clear_history(self, arguments: dict) -> list[TextContent]:
+        """Clear a session's conversation history."""
+        session = await self._get_or_create_session(
+            arguments.get("session_id", "default")
+        )
+        session.conversation.clear_history()
+        return [
+            TextContent(
+                type="text",
+                text=f"Conversation history cleared for session '{session.session_id}'",
+            )
+        ]
+
+    async def _handle_create_session(self, arguments: dict) -> list[TextContent]:
+        """Create a new named session, failing if the name is taken."""
+        session_id = arguments.get("session_id")
+        if not session_id:
+            return _ERR_NO_SESSION_ID
+        if session_id in self.sessions:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error: session '{session_id}' already exists",
+                )
+            ]
+
+        self.sessions[session_id] = ConversationSession(
+            session_id=session_id,
+            model_name=_DEFAULT_MODEL,
+            conversation=ConversationManager(),
+            created_at=datetime.now().isoformat(),
+        )
+        self._evict_over_limit()
+        await self.session_cache.set_cache(
+            session_key(session_id, "created_at"),
+            self.sessions[session_id].created_at,
+        )
+        return [TextContent(type="text", text=f"Session '{session_id}' created")]
+
+    async def _handle_list_sessions(self, arguments: dict) -> list[TextContent]:
+        """List all active sessions as JSON."""
+        sessions = [
+            {
+                "session_id": session.session_id,
+                "created_at": session.created_at,
+                "message_count": session.message_count,
+            }
+            for session in self.sessions.values()
+        ]
+        return [
+            TextContent(
+                type="text",
+                text=orjson.dumps(sessions, option=orjson.OPT_INDENT_2).decode(),
+            )
+        ]
+
+    @staticmethod
+    def _widen_stdout_buffer(size: int = 65536) -> None:
+        """
+        Give stdout a large block buffer before the transport wraps it.
+
+        The stdio transport flushes at message boundaries, so a buffer
+        that fits a whole JSON-RPC frame means one write() syscall per
+        message instead of one per 8KB default-buffer chunk. Latency is
+        unchanged; only syscall count drops for large responses.
+
+        Args:
+            size: Buffer size in bytes
+        """
+        try:
+            raw = getattr(sys.stdout.buffer, "raw", None)
+            if raw is not None:
+                sys.stdout = io.TextIOWrapper(
+                    io.BufferedWriter(raw, buffer_size=size),
+                    encoding="utf-8",
+                    line_buffering=False,
+                )
+        except (AttributeError, ValueError):
+            logger.exception("Could not widen stdout buffer")
+
+    async def run(self) -> None:
+        """Run the server over stdio until the client disconnects."""
+        self._widen_stdout_buffer()
+        self._rephrase_worker = asyncio.create_task(self._rephrase_batch_worker())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self._rephrase_worker.cancel()
+            for assistant in self._assistants.values():
+                await assistant.aclose()
+
+
+def main() -> None:
+    """Entry point for running the MCP server."""
+    server = PydanticAIMCPServer()
+    asyncio.run(server.run())
+
+
+if __name__ == "__main__":
+    main()
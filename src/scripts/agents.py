@@ -1,42 +1,74 @@
-from dotenv import load_dotenv
+"""Lazily constructed standalone agents for scripts and experiments.
+
+The main application uses src/ai/agent_manager.py; this module keeps the
+script-friendly agents but defers construction (and .env parsing) until an
+agent is actually requested, so importing it is free.
+"""
+
+from functools import cache
+from typing import Literal
+
 from pydantic_ai import Agent
 
-# Load environment variables from .env file
-load_dotenv()
-
-
-# Conversational AI agent
-conversation_agent = Agent(
-    "openai:gpt-4o",  # Use gpt-4o or gpt-4o-mini available through GitHub
-    system_prompt=(
-        "You are a friendly, helpful, and engaging conversational AI assistant. "
-        "Your personality is warm, approachable, and genuinely interested in "
-        "helping users. You should:\n"
-        "- Be conversational and natural in your responses\n"
-        "- Show enthusiasm and interest in the user's questions\n"
-        "- Provide helpful and detailed answers when needed\n"
-        "- Ask follow-up questions to better understand what the user needs\n"
-        "- Use a warm, friendly tone like you're talking to a good friend\n"
-        "- Remember context from the conversation to make it flow naturally\n"
-        "- Be encouraging and supportive\n"
-        "- Keep responses engaging but not overly long unless requested"
-    ),
+_CONVERSATION_PROMPT = (
+    "You are a friendly, helpful, and engaging conversational AI assistant. "
+    "Your personality is warm, approachable, and genuinely interested in "
+    "helping users. You should:\n"
+    "- Be conversational and natural in your responses\n"
+    "- Show enthusiasm and interest in the user's questions\n"
+    "- Provide helpful and detailed answers when needed\n"
+    "- Ask follow-up questions to better understand what the user needs\n"
+    "- Use a warm, friendly tone like you're talking to a good friend\n"
+    "- Remember context from the conversation to make it flow naturally\n"
+    "- Be encouraging and supportive\n"
+    "- Keep responses engaging but not overly long unless requested"
 )
 
-# Rephrasing/Grammar AI agent
-rephrasing_agent = Agent(
-    "openai:gpt-4o",  # Use gpt-4o or gpt-4o-mini available through GitHub
-    system_prompt=(
-        "You are a professional writing assistant specialized in rephrasing "
-        "and grammar correction. Your job is to improve text while preserving "
-        "the original meaning, tone, and intent. You should:\n"
-        "- Fix grammar, spelling, and punctuation errors\n"
-        "- Improve clarity and readability\n"
-        "- Enhance word choice and sentence structure\n"
-        "- Maintain the original tone and style\n"
-        "- Preserve the author's voice and intent\n"
-        "- Return ONLY the improved version without explanations or commentary\n"
-        "- Keep the same level of formality as the original\n"
-        "- Don't add new information or change the meaning"
-    ),
+_REPHRASING_PROMPT = (
+    "You are a professional writing assistant specialized in rephrasing "
+    "and grammar correction. Your job is to improve text while preserving "
+    "the original meaning, tone, and intent. You should:\n"
+    "- Fix grammar, spelling, and punctuation errors\n"
+    "- Improve clarity and readability\n"
+    "- Enhance word choice and sentence structure\n"
+    "- Maintain the original tone and style\n"
+    "- Preserve the author's voice and intent\n"
+    "- Return ONLY the improved version without explanations or commentary\n"
+    "- Keep the same level of formality as the original\n"
+    "- Don't add new information or change the meaning"
 )
+
+_PROMPTS = {
+    "conversation": _CONVERSATION_PROMPT,
+    "rephrasing": _REPHRASING_PROMPT,
+}
+
+_env_loaded = False
+
+
+def _load_env_once() -> None:
+    """Parse .env on the first agent construction only."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+@cache
+def get_agent(role: Literal["conversation", "rephrasing"]) -> Agent:
+    """
+    Get the shared agent for a role, constructing it on first access.
+
+    Args:
+        role: Which agent to return
+
+    Returns:
+        The process-wide Agent for the role
+    """
+    _load_env_once()
+    return Agent(
+        "openai:gpt-4o",  # Use gpt-4o or gpt-4o-mini available through GitHub
+        system_prompt=_PROMPTS[role],
+    )
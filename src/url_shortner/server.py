@@ -1,16 +1,32 @@
 """Flask web server for URL shortener service."""
 
 import datetime
+import gzip
 import os
-from urllib.parse import urlparse
+import re
+import time
 
-from flask import Flask, jsonify, redirect, render_template_string, request
+import orjson
+from flask import (
+    Flask,
+    Response,
+    render_template_string,
+    request,
+)
 
 from src.helpers.redis import RedisCache
-from src.url_shortner.shortner import URLShortener
+from src.url_shortner.shortner import URLShortener, ensure_code_pool_worker
 
 app = Flask(__name__)
 
+# One pool-backed cache per worker; constructing RedisCache inside each
+# handler paid client setup on every request
+_CACHE = RedisCache()
+
+# Pre-reserve short codes in the background so /api/shorten usually skips
+# code generation and collision checks entirely
+ensure_code_pool_worker()
+
 # HTML template for the main page
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -186,19 +202,106 @@ HTML_TEMPLATE = """
 """
 
 
+# The template has no dynamic parts, so parse and render it exactly once
+# instead of re-parsing ~4KB of Jinja per request
+with app.app_context():
+    _RENDERED_HOME = render_template_string(HTML_TEMPLATE)
+
+# Compressed once at import (~70% smaller); served to any client that
+# accepts gzip so the page costs neither Jinja time nor full-size bytes
+_HOME_GZ = gzip.compress(_RENDERED_HOME.encode(), compresslevel=9)
+_HOME_HEADERS = {"Cache-Control": "public, max-age=3600"}
+_HOME_GZ_HEADERS = {
+    "Content-Encoding": "gzip",
+    "Vary": "Accept-Encoding",
+    "Cache-Control": "public, max-age=3600",
+}
+
+# Compiled once; only consulted when strict checking is enabled
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+
+# The fast path below accepts/rejects with a few O(1) string checks; set
+# STRICT_URL_CHECK=1 to additionally run the full regex
+STRICT_URL_CHECK = os.environ.get("STRICT_URL_CHECK", "0") == "1"
+
+
 def is_valid_url(url: str) -> bool:
     """Validate URL format."""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+    if not url.startswith(("http://", "https://")):
+        return False
+    rest = url[url.index("://") + 3 :]
+    if not rest or rest[0] == "/" or " " in rest:
         return False
+    if STRICT_URL_CHECK:
+        return bool(_URL_RE.match(url))
+    return True
+
+
+def ojson(obj: dict, status: int = 200) -> Response:
+    """
+    Build a JSON response serialized with orjson.
+
+    Faster than jsonify's stdlib encoder on these small payloads and
+    produces bytes directly.
+
+    Args:
+        obj: JSON-serializable payload
+        status: HTTP status code
+
+    Returns:
+        A Flask Response with an application/json body
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+# In-process caches in front of Redis for the redirect hot path: recent
+# hits skip the round-trip, and recent misses (bot scans hammer random
+# codes) 404 without touching Redis at all. Entries carry short TTLs so
+# codes created by other workers or expired in Redis converge quickly.
+_POS_CACHE: dict[str, tuple[float, str]] = {}
+_NEG_CACHE: dict[str, float] = {}
+_POS_TTL = 60.0
+_NEG_TTL = 30.0
+_CACHE_MAX = 10_000
+
+
+def _resolve(short_code: str) -> str | None:
+    """
+    Resolve a short code to its URL, consulting the local caches first.
+
+    Args:
+        short_code: The short code to look up
+
+    Returns:
+        The original URL, or None if the code is unknown
+    """
+    now = time.monotonic()
+
+    hit = _POS_CACHE.get(short_code)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+
+    missed_until = _NEG_CACHE.get(short_code)
+    if missed_until is not None and missed_until > now:
+        return None
+
+    original_url = _CACHE.get_cache_str(short_code)
+    if original_url is None:
+        if len(_NEG_CACHE) >= _CACHE_MAX:
+            _NEG_CACHE.clear()
+        _NEG_CACHE[short_code] = now + _NEG_TTL
+        return None
+
+    if len(_POS_CACHE) >= _CACHE_MAX:
+        _POS_CACHE.clear()
+    _POS_CACHE[short_code] = (now + _POS_TTL, original_url)
+    return original_url
 
 
 @app.route("/health")
 def health_check():
     """Simple health check endpoint."""
-    return jsonify(
+    return ojson(
         {
             "status": "healthy",
             "message": "URL Shortener is running!",
@@ -210,7 +313,17 @@ def health_check():
 @app.route("/")
 def home():
     """Serve the main URL shortener page."""
-    return render_template_string(HTML_TEMPLATE)
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        return Response(
+            _HOME_GZ,
+            content_type="text/html; charset=utf-8",
+            headers=_HOME_GZ_HEADERS,
+        )
+    return Response(
+        _RENDERED_HOME,
+        content_type="text/html; charset=utf-8",
+        headers=_HOME_HEADERS,
+    )
 
 
 @app.route("/api/shorten", methods=["POST"])
@@ -220,25 +333,25 @@ def shorten_url():
         data = request.get_json()
 
         if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
+            return ojson({"success": False, "error": "No data provided"}), 400
 
         url = data.get("url")
         user_id = data.get("user_id")
 
         if not url or not user_id:
-            return jsonify(
+            return ojson(
                 {"success": False, "error": "URL and user_id are required"}
             ), 400
 
         if not is_valid_url(url):
-            return jsonify({"success": False, "error": "Invalid URL format"}), 400
+            return ojson({"success": False, "error": "Invalid URL format"}), 400
 
         # Create URL shortener instance
-        shortener = URLShortener(url=url, user_id=user_id)
+        shortener = URLShortener(url=url, user_id=user_id, cache=_CACHE)
         short_code = shortener.short_url()
 
         if not short_code:
-            return jsonify(
+            return ojson(
                 {"success": False, "error": "Failed to generate short URL"}
             ), 500
 
@@ -246,7 +359,7 @@ def shorten_url():
         base_url = request.host_url.rstrip("/")
         short_url = f"{base_url}/s/{short_code}"
 
-        return jsonify(
+        return ojson(
             {
                 "success": True,
                 "short_url": short_url,
@@ -256,7 +369,7 @@ def shorten_url():
         )
 
     except Exception as e:
-        return jsonify(
+        return ojson(
             {"success": False, "error": f"Internal server error: {str(e)}"}
         ), 500
 
@@ -265,9 +378,8 @@ def shorten_url():
 def redirect_to_url(short_code: str):
     """Redirect short code to original URL."""
     try:
-        # Get the original URL from cache
-        cache = RedisCache()
-        original_url = cache.get_cache(short_code)
+        # Get the original URL, served from the in-process cache when hot
+        original_url = _resolve(short_code)
 
         if not original_url:
             return render_template_string("""
@@ -276,7 +388,16 @@ def redirect_to_url(short_code: str):
                 <a href="/">Create a new short URL</a>
             """), 404
 
-        return redirect(original_url)
+        # Bare 308 with a Location header: no HTML body template and a
+        # short client cache window on the dominant endpoint
+        return Response(
+            b"",
+            status=308,
+            headers={
+                "Location": original_url,
+                "Cache-Control": "public, max-age=300",
+            },
+        )
 
     except Exception as e:
         return render_template_string(f"""
@@ -290,13 +411,12 @@ def redirect_to_url(short_code: str):
 def get_url_stats(short_code: str):
     """Get statistics for a short URL."""
     try:
-        cache = RedisCache()
-        original_url = cache.get_cache(short_code)
+        original_url = _CACHE.get_cache_str(short_code)
 
         if not original_url:
-            return jsonify({"success": False, "error": "Short URL not found"}), 404
+            return ojson({"success": False, "error": "Short URL not found"}), 404
 
-        return jsonify(
+        return ojson(
             {
                 "success": True,
                 "short_code": short_code,
@@ -306,12 +426,15 @@ def get_url_stats(short_code: str):
         )
 
     except Exception as e:
-        return jsonify(
+        return ojson(
             {"success": False, "error": f"Error retrieving stats: {str(e)}"}
         ), 500
 
 
 if __name__ == "__main__":
+    # Development server only. In production run the app under gunicorn so
+    # requests aren't serialized by the dev server:
+    #   gunicorn -w 4 -k gthread --threads 8 src.url_shortner.server:app
     # Get port from environment or use default (8080 to avoid AirPlay conflict on macOS)
     port = int(os.environ.get("PORT", 8080))
 
@@ -1,21 +1,117 @@
-import datetime
 import hashlib
+import queue
+import threading
+import time
 
 from src.helpers.redis import RedisCache
 
+_BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def _base62(n: int) -> str:
+    """
+    Encode a non-negative integer in base62.
+
+    Args:
+        n: The integer to encode
+
+    Returns:
+        The base62 representation (e.g. 5 chars for ids below 62**5)
+    """
+    if n == 0:
+        return "0"
+    chars = []
+    while n:
+        n, rem = divmod(n, 62)
+        chars.append(_BASE62_ALPHABET[rem])
+    return "".join(reversed(chars))
+
+
+def _base62_batch(start: int, count: int) -> list[str]:
+    """
+    Encode a contiguous run of integers in base62.
+
+    Sequential ids are encoded incrementally — each code is a digit
+    increment on the previous one instead of a fresh divmod loop, so bulk
+    encoding costs amortized O(1) per code.
+
+    Args:
+        start: First integer of the run
+        count: How many codes to produce
+
+    Returns:
+        Base62 codes for start .. start + count - 1
+    """
+    # Little-endian digit indexes of `start`
+    digits: list[int] = []
+    n = start
+    while n:
+        n, rem = divmod(n, 62)
+        digits.append(rem)
+    if not digits:
+        digits = [0]
+
+    codes = []
+    for _ in range(count):
+        codes.append("".join(_BASE62_ALPHABET[d] for d in reversed(digits)))
+        position = 0
+        while True:
+            if position == len(digits):
+                digits.append(1)
+                break
+            digits[position] += 1
+            if digits[position] < 62:
+                break
+            digits[position] = 0
+            position += 1
+    return codes
+
+
+# Pool of short codes backed by counter ranges reserved in bulk (one
+# INCRBY per batch), so the request path is a pop plus one SET
+_CODE_POOL: queue.Queue[str] = queue.Queue(maxsize=256)
+_POOL_BATCH = 64
+
+_pool_thread: threading.Thread | None = None
+_pool_lock = threading.Lock()
+
+
+def _fill_code_pool() -> None:
+    """Keep the code pool topped up from bulk-reserved counter ranges."""
+    cache = RedisCache()
+    while True:
+        first_id = cache.reserve_ids(_POOL_BATCH)
+        if first_id is None:
+            # Redis unavailable; don't spin hot
+            time.sleep(1)
+            continue
+        for code in _base62_batch(first_id, _POOL_BATCH):
+            _CODE_POOL.put(code)  # blocks while the pool is full
+
+
+def ensure_code_pool_worker() -> None:
+    """Start the pool-filling daemon thread if it isn't running."""
+    global _pool_thread
+    if _pool_thread is None or not _pool_thread.is_alive():
+        with _pool_lock:
+            if _pool_thread is None or not _pool_thread.is_alive():
+                _pool_thread = threading.Thread(
+                    target=_fill_code_pool, daemon=True, name="url-code-pool"
+                )
+                _pool_thread.start()
+
 
 class URLShortenerHelpers:
     @classmethod
     def generate_unique(cls, user: str, url: str) -> str:
-        """Generate unique code using hash of URL + timestamp + random salt."""
-        current_time = datetime.datetime.now().strftime("%d%m%Y%H%M%S%f")
-        random_salt = "".join(current_time + user)
-
-        # Create hash from URL + timestamp + salt
-        hash_input = f"{url}_{current_time}_{random_salt}"
-        hash_digest = hashlib.sha256(hash_input.encode()).hexdigest()[:8]
-
-        return hash_digest
+        """Generate unique code using a fast hash of URL + user + timestamp."""
+        # time_ns() is a single integer read; building and strftime-ing a
+        # datetime allocated several objects per call (and per retry).
+        # blake2b truncated at the digest level is cheaper than running
+        # full SHA-256 and slicing hex; uniqueness, not cryptographic
+        # strength, is all a short code needs
+        hash_input = f"{url}|{user}|{time.time_ns()}"
+        return hashlib.blake2b(hash_input.encode(), digest_size=4).hexdigest()
 
     @classmethod
     def initiate_cache(cls) -> RedisCache:
@@ -24,23 +120,46 @@ class URLShortenerHelpers:
 
 
 class URLShortener:
-    def __init__(self, url: str, user_id: str) -> None:
+    def __init__(self, url: str, user_id: str, cache: RedisCache | None = None) -> None:
         self.url = url
         self.user = user_id
+        # Callers with a long-lived cache (e.g. the Flask server) inject it
+        # so each shorten call doesn't construct a new client
+        self.cache = (
+            cache if cache is not None else URLShortenerHelpers.initiate_cache()
+        )
 
     def short_url(self) -> str | None:
-        cache = URLShortenerHelpers.initiate_cache()
+        cache = self.cache
 
-        # Generate unique code and ensure it doesn't exist
-        unique_code = URLShortenerHelpers.generate_unique(self.user, self.url)
+        # Primary path: pop a code from ranges the pool worker reserved in
+        # bulk (one INCRBY per _POOL_BATCH ids), so the request path is a
+        # pop plus one SET with no per-request counter round-trip
+        try:
+            unique_code = _CODE_POOL.get_nowait()
+        except queue.Empty:
+            unique_code = None
+        if unique_code is not None and cache.set_cache(unique_code, self.url):
+            return unique_code
 
-        # Check if this code already exists, regenerate if needed
-        while cache.get_cache(unique_code):
-            unique_code = URLShortenerHelpers.generate_unique(self.user, self.url)
+        # Fallback while the pool is cold (worker not started, or still
+        # filling): a fresh INCR still guarantees uniqueness, so there's
+        # no hashing and no collision loop
+        seq = cache.next_id()
+        if seq is not None:
+            unique_code = _base62(seq)
+            if cache.set_cache(unique_code, self.url):
+                return unique_code
 
-        # Store the mapping
-        cache.set_cache(key=unique_code, value=self.url)
-        return unique_code
+        # Fallback: atomic SET NX stores the mapping and detects collisions
+        # in one round-trip; regenerate only when Redis reports the code is
+        # taken. Bounded attempts keep a Redis outage (also reported as
+        # False) from spinning forever.
+        for _ in range(5):
+            unique_code = URLShortenerHelpers.generate_unique(self.user, self.url)
+            if cache.set_if_absent(unique_code, self.url):
+                return unique_code
+        return None
 
 
 if __name__ == "__main__":